@@ -8,33 +8,66 @@ basic job listings.
 
 Python: 3.9+
 Install:
-    pip install streamlit requests beautifulsoup4 openai
+    pip install streamlit "httpx[http2,brotli]" beautifulsoup4 lxml orjson "openai>=1.0"
+    pip install flashtext  # optional: faster matching for long keyword lists
 
 Run:
     streamlit run google_jobs_automation.py
 """
 import os
 import re
+import asyncio
+import functools
+import threading
+import time
 import json
 import urllib.parse
-from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from dotenv import load_dotenv
 load_dotenv()  # loads .env into environment variables
 
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Prefer streaming the page through lxml; fall back to BeautifulSoup's pure-Python parser
+# if lxml isn't installed.
+USE_LXML = True
+try:
+    from lxml import etree
+except ImportError:
+    USE_LXML = False
 
 try:
     import streamlit as st
 except Exception:
     raise RuntimeError("This file is meant to be run with Streamlit: streamlit run google_jobs_automation.py")
 
+# FlashText matches the heuristic keywords in one trie pass, whatever the keyword count.
+# Optional: the precompiled regex alternation is used when it isn't installed.
+USE_FLASHTEXT = True
+try:
+    from flashtext import KeywordProcessor
+except ImportError:
+    USE_FLASHTEXT = False
+
+# orjson parses/serialises several times faster than the stdlib; use it when installed.
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 # Try to import openai for LLM mode. If not installed, LLM won't be available.
 USE_LLM = True
 try:
-    import openai
+    from openai import OpenAI
 except Exception:
     USE_LLM = False
 
@@ -42,16 +75,20 @@ BASE_URL = "https://www.google.com/about/careers/applications/jobs/results/"
 
 # --- Utilities: Build URL from filters ---
 def build_google_careers_url(filters: Dict[str, str]) -> str:
-    params = {}
-    for k, v in filters.items():
-        if v is None or v == "":
-            continue
+    # dicts aren't hashable, so normalise into a tuple key for the cached builder
+    return _build_url(tuple((k, str(v)) for k, v in filters.items() if v is not None and v != ""))
+
+_BOOL_MAP = {"true": "true", "1": "true", "yes": "true"}
+
+@functools.lru_cache(maxsize=256)
+def _build_url(items: Tuple[Tuple[str, str], ...]) -> str:
+    # in LLM mode keys are whatever the model returned, so quote them as well as the values
+    parts = []
+    for k, v in items:
         if k == "has_remote":
-            params[k] = "true" if str(v).lower() in ("true", "1", "yes") else "false"
-        else:
-            params[k] = str(v)
-    query = urllib.parse.urlencode(params, safe=',')
-    return BASE_URL + ("?" + query if query else "")
+            v = _BOOL_MAP.get(v.lower(), "false")
+        parts.append(quote_plus(k) + "=" + quote_plus(v, safe=','))
+    return BASE_URL + ("?" + "&".join(parts) if parts else "")
 
 # --- Heuristic keyword lists & parser ---
 LOCATIONS_KEYWORDS = [
@@ -80,49 +117,109 @@ EMPLOYMENT_TYPES = {
     "internship": "INTERN",
 }
 
-def heuristic_extract_filters(query: str) -> Dict[str, Optional[str]]:
+def _canonical_location(loc: str) -> str:
+    if loc.lower() in ("bengaluru", "bangalore"):
+        return "Bangalore, India"
+    if loc.lower() == "hyderabad":
+        return "Hyderabad, India"
+    return loc
+
+def _keyword_groups() -> Tuple[Dict[str, List[str]], Dict[str, Tuple[str, str]]]:
+    """Fold every keyword list into groups of lowercased keywords, one per (field, value).
+
+    Groups are ordered like the old per-list loops ran, so applying matches in group order
+    replays their precedence. A keyword listed twice (e.g. "intern") keeps its first
+    mapping, since the earlier loop used to strip it from the query.
+    """
+    entries = [("has_remote", "true", loc) if loc.lower() == "remote" else ("location", _canonical_location(loc), loc)
+               for loc in LOCATIONS_KEYWORDS]
+    for field, table in (("target_level", LEVEL_KEYWORDS), ("degree", DEGREE_KEYWORDS), ("employment_type", EMPLOYMENT_TYPES)):
+        entries.extend((field, val, word) for word, val in table.items())
+
+    prefixes = {"location": "loc", "has_remote": "rem", "target_level": "lvl", "degree": "deg", "employment_type": "emp"}
+    groups: Dict[str, List[str]] = {}
+    group_map: Dict[str, Tuple[str, str]] = {}
+    seen = set()
+    for field, val, word in entries:
+        if word.lower() in seen:
+            continue
+        seen.add(word.lower())
+        name = prefixes[field] + "_" + re.sub(r"\W+", "_", val.lower())
+        groups.setdefault(name, []).append(word.lower())
+        group_map[name] = (field, val)
+    return groups, group_map
+
+def _build_master_pattern(groups: Dict[str, List[str]]) -> "re.Pattern[str]":
+    """One alternation with a named group per keyword group."""
+    alternatives = "|".join(
+        f"(?P<{name}>" + "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)) + ")"
+        for name, words in groups.items()
+    )
+    # keywords are lowercased and matched against query.lower(), which is cheaper than IGNORECASE
+    return re.compile(r"\b(?:" + alternatives + r")\b")
+
+class _UnicodeWordChars(set):
+    """Membership test matching re's Unicode ``\\w``, which FlashText's ASCII-only default lacks."""
+
+    def __contains__(self, char) -> bool:
+        return char == "_" or char.isalnum()
+
+def _build_keyword_processor(groups: Dict[str, List[str]]) -> "KeywordProcessor":
+    """FlashText trie over the same groups; matching cost doesn't grow with the keyword count.
+
+    Word boundaries follow the regex path's ``\\b``, so "internéship" doesn't match "intern" on either path.
+    """
+    kp = KeywordProcessor(case_sensitive=True)  # queries are lowercased before matching
+    kp.set_non_word_boundaries(_UnicodeWordChars())
+    for name, words in groups.items():
+        for word in words:
+            kp.add_keyword(word, name)
+    return kp
+
+# built once at import; heuristic_extract_filters runs on every Streamlit rerun
+_KEYWORD_GROUPS, _GROUP_MAP = _keyword_groups()
+_GROUP_RANK = {name: rank for rank, name in enumerate(_KEYWORD_GROUPS)}
+_MASTER_PATTERN = _build_master_pattern(_KEYWORD_GROUPS)
+_KEYWORD_PROCESSOR = _build_keyword_processor(_KEYWORD_GROUPS) if USE_FLASHTEXT else None
+_CLEAN_NONWORD = re.compile(r"[^A-Za-z0-9,\s.-]")
+_CLEAN_WS = re.compile(r"\s{2,}")
+
+def _keyword_matches(q_lower: str) -> List[Tuple[str, int, int]]:
+    """(group name, start, end) for every keyword in the lowercased query, in text order."""
+    if _KEYWORD_PROCESSOR is not None:
+        return _KEYWORD_PROCESSOR.extract_keywords(q_lower, span_info=True)
+    return [(m.lastgroup, m.start(), m.end()) for m in _MASTER_PATTERN.finditer(q_lower)]
+
+def heuristic_extract_filters(query: str) -> Dict[str, str]:
     q = query or ""
-    filters = {"location": "", "target_level": "", "degree": "", "has_remote": "", "employment_type": "", "q": ""}
-
-    # locations
-    for loc in LOCATIONS_KEYWORDS:
-        if re.search(r"\b" + re.escape(loc) + r"\b", q, re.IGNORECASE):
-            if loc.lower() == "remote":
-                filters["has_remote"] = "true"
-            else:
-                if loc.lower() in ("bengaluru", "bangalore"):
-                    filters["location"] = "Bangalore, India"
-                elif loc.lower() == "hyderabad":
-                    filters["location"] = "Hyderabad, India"
-                else:
-                    filters["location"] = loc
-            q = re.sub(r"\b" + re.escape(loc) + r"\b", " ", q, flags=re.IGNORECASE)
-
-    # level
-    for word, val in LEVEL_KEYWORDS.items():
-        if re.search(r"\b" + re.escape(word) + r"\b", q, re.IGNORECASE):
-            filters["target_level"] = val
-            q = re.sub(r"\b" + re.escape(word) + r"\b", " ", q, flags=re.IGNORECASE)
-
-    # degree
-    for word, val in DEGREE_KEYWORDS.items():
-        if re.search(r"\b" + re.escape(word) + r"\b", q, re.IGNORECASE):
-            filters["degree"] = val
-            q = re.sub(r"\b" + re.escape(word) + r"\b", " ", q, flags=re.IGNORECASE)
-
-    # employment type
-    for word, val in EMPLOYMENT_TYPES.items():
-        if re.search(r"\b" + re.escape(word) + r"\b", q, re.IGNORECASE):
-            filters["employment_type"] = val
-            q = re.sub(r"\b" + re.escape(word) + r"\b", " ", q, flags=re.IGNORECASE)
+    q_lower = q.lower()
+    if len(q_lower) != len(q):
+        # some non-ASCII case mappings change length; spans only line up on the lowered text
+        q = q_lower
+    filters: Dict[str, str] = {}
+
+    # single pass over the query; later groups win like the old sequential loops did
+    matches = _keyword_matches(q_lower)
+    for name, _, _ in sorted(matches, key=lambda m: _GROUP_RANK[m[0]]):
+        field, val = _GROUP_MAP[name]
+        filters[field] = val
+
+    # cut matched keywords out of the original (case-preserved) query
+    pieces = []
+    pos = 0
+    for _, match_start, match_end in matches:
+        pieces.append(q[pos:match_start])
+        pos = match_end
+    pieces.append(q[pos:])
+    q = " ".join(pieces)
 
     # leftover -> q
-    clean_q = re.sub(r"[^A-Za-z0-9,\s.-]", " ", q).strip()
-    clean_q = re.sub(r"\s{2,}", " ", clean_q)
+    clean_q = _CLEAN_NONWORD.sub(" ", q).strip()
+    clean_q = _CLEAN_WS.sub(" ", clean_q)
     if clean_q:
         filters["q"] = clean_q
 
-    return {k: v for k, v in filters.items() if v}
+    return filters
 
 # --- LLM extractor using openai directly (no LangChain) ---
 LLM_PROMPT = """
@@ -138,63 +235,273 @@ Input: {user_query}
 Output:
 """
 
-def extract_with_llm(user_query: str, openai_api_key: Optional[str]) -> Dict[str, str]:
+LLM_MODEL = "gpt-4o-mini"
+
+def _extract_json_object(text: str) -> str:
+    """Return the first balanced {...} block in text.
+
+    A single linear scan that skips braces inside strings; a greedy catch-all regex
+    can backtrack badly on malformed output.
+    """
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("no JSON object found")
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    raise ValueError("unbalanced JSON object")
+
+@st.cache_resource
+def get_openai_client(openai_api_key: str) -> "OpenAI":
+    return OpenAI(api_key=openai_api_key)
+
+def extract_with_llm(user_query: str, openai_api_key: Optional[str], placeholder=None,
+                     model: str = LLM_MODEL) -> Dict[str, str]:
+    """Ask the model for filters as a JSON object.
+
+    If a Streamlit ``placeholder`` (e.g. ``st.empty()``) is given, the response is streamed
+    into it as it arrives.
+    """
     if not USE_LLM:
         raise RuntimeError("OpenAI python package not installed. Install it with: pip install openai")
 
     if not openai_api_key:
         raise RuntimeError("OpenAI API key not provided for LLM extraction.")
 
-    # configure client
-    openai.api_key = openai_api_key
-
-    prompt = LLM_PROMPT.replace("{user_query}", json.dumps(user_query))
+    client = get_openai_client(openai_api_key)
+    prompt = LLM_PROMPT.replace("{user_query}", json_dumps(user_query))
+    request = dict(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You extract job-search filters into JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0,
+        max_tokens=200,
+        # JSON mode guarantees a parseable object, so no regex extraction is needed
+        response_format={"type": "json_object"},
+    )
 
     try:
-        resp = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You extract job-search filters into JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.0,
-            max_tokens=300,
-        )
+        if placeholder is None:
+            resp = client.chat.completions.create(**request)
+            assistant_text = resp.choices[0].message.content or ""
+        else:
+            parts = []
+            for chunk in client.chat.completions.create(stream=True, **request):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    placeholder.code("".join(parts), language="json")
+            assistant_text = "".join(parts)
     except Exception as e:
         raise RuntimeError("OpenAI request failed: " + str(e))
 
-    assistant_text = resp["choices"][0]["message"]["content"]
-
-    # attempt to find and parse JSON block
-    m = re.search(r"\{[\s\S]*\}", assistant_text)
-    if m:
-        try:
-            return json.loads(m.group(0))
-        except Exception:
-            cleaned = assistant_text.strip().replace("'", '"')
-            m2 = re.search(r"\{[\s\S]*\}", cleaned)
-            if m2:
-                return json.loads(m2.group(0))
-            raise RuntimeError("LLM returned JSON-like text but it couldn't be parsed:\n" + assistant_text)
-    else:
-        try:
-            return json.loads(assistant_text)
-        except Exception:
-            raise RuntimeError("LLM did not return a JSON object:\n" + assistant_text)
+    try:
+        return json_loads(assistant_text)
+    except Exception:
+        pass
+    # JSON mode should make this unreachable, but a model or proxy that ignores
+    # response_format may still wrap the object in prose
+    try:
+        return json_loads(_extract_json_object(assistant_text))
+    except Exception:
+        raise RuntimeError("LLM did not return a JSON object:\n" + assistant_text)
+
+LLM_CACHE_TTL = 24 * 60 * 60
+LLM_CACHE_SIZE = 1024
+
+@st.cache_resource
+def _llm_cache() -> Tuple[Dict[Tuple[str, str], Tuple[float, Dict[str, str]]], threading.Lock]:
+    # shared by every session thread, so reads and evict-writes go through the lock
+    return {}, threading.Lock()
+
+def extract_with_llm_cached(user_query: str, openai_api_key: Optional[str], placeholder=None,
+                            model: str = LLM_MODEL) -> Dict[str, str]:
+    """extract_with_llm, memoised per (model, query) across reruns and sessions.
+
+    The prompt runs at temperature 0, so answers are reused for a day. This is a plain
+    dict behind cache_resource rather than st.cache_data, because cache_data can't replay
+    writes into a placeholder created outside the cached function.
+    """
+    cache, lock = _llm_cache()
+    key = (model, user_query)
+    with lock:
+        hit = cache.get(key)
+    if hit and time.monotonic() - hit[0] < LLM_CACHE_TTL:
+        return dict(hit[1])
+
+    # the API call runs outside the lock so one slow request doesn't block other sessions
+    filters = extract_with_llm(user_query, openai_api_key, placeholder, model=model)
+    with lock:
+        cache.pop(key, None)
+        if len(cache) >= LLM_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic(), filters)
+    return dict(filters)
 
 # --- Scraping Google Careers results page ---
-def fetch_search_results(url: str, timeout: int = 10) -> List[Dict[str, str]]:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
+
+MAX_PAGES = 10
+
+# The careers SPA loads listings from an internal JSON endpoint. Its URL isn't documented or
+# stable, so using it is opt-in; the HTML scrape below remains the fallback.
+JSON_ENDPOINT = os.environ.get("GOOGLE_CAREERS_JSON_URL", "")
+
+def _page_url(url: str, page: int) -> str:
+    if page == 1:
+        return url
+    return url + ("&" if "?" in url else "?") + f"page={page}"
+
+async def _new_async_client() -> httpx.AsyncClient:
+    # HTTP/2 needs the h2 package and brotli decoding the brotli package (httpx[http2,brotli]);
+    # httpx only advertises "br" when it can decode it, and falls back to HTTP/1.1 keep-alive.
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True, retries=1, limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        ),
+    )
+
+# Streamlit re-executes this module on every rerun, and an AsyncClient is bound to the event
+# loop it runs on. cache_resource keeps one loop on a background thread together with one
+# pooled client, so connections (and their TLS sessions) survive from one search to the next.
+@st.cache_resource
+def get_fetcher() -> Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="careers-fetch", daemon=True).start()
+    client = asyncio.run_coroutine_threadsafe(_new_async_client(), loop).result()
+    return loop, client
+
+class JobResult(NamedTuple):
+    # a tuple per result instead of a dict keeps large result pages compact
+    title: str
+    link: str
+    location: str = ""
+    snippet: str = ""
+
+CHUNK_SIZE = 64 * 1024
+LD_JSON_TYPE = "application/ld+json"
+_LOC_HINT = re.compile(r",|India|USA|UK|Remote")
+_LD_JSON_SCRIPT = re.compile(
+    rb'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+_BODY_ONLY = SoupStrainer("body")
+# suspect job link patterns, same as _JOB_ANCHORS below
+_JOB_HREF = re.compile(r"/careers|/jobs/results")
+
+if USE_LXML:
+    # suspect job link patterns, matched inside libxml2 rather than per anchor in Python
+    # ("/about/careers" is covered by "/careers")
+    _JOB_ANCHORS = etree.XPath("//a[@href and (contains(@href, '/careers') or contains(@href, '/jobs/results'))]")
+
+def _canonical_link(href: str) -> Tuple[str, str]:
+    """Return (absolute link, link without query) for dedupe."""
+    link = urllib.parse.urljoin(BASE_URL, href)
+    return link, link.split('?', 1)[0]
+
+def _job_result(link: str, title: str, texts: List[str]) -> JobResult:
+    """Build a result from a job anchor's link/title and its parent's text."""
+    location = ""
+    snippet = ""
+    if texts:
+        # find candidate location-like text
+        for t in texts:
+            if len(t) < 100 and _LOC_HINT.search(t):
+                location = t
+                break
+        snippet = texts[0][:300]
+    return JobResult(title, link, location, snippet)
+
+class _StreamScraper:
+    """Feed a results page into lxml chunk by chunk as it downloads.
+
+    Job anchors are selected with one XPath query once the whole document has been fed,
+    since their location/snippet comes from the parent's text. Script and style bodies
+    (most of a Google Careers page) are dropped as soon as they close.
+    """
+
+    def __init__(self, encoding: Optional[str] = None):
+        # the Content-Type charset, when sent; otherwise lxml sniffs <meta charset>
+        self.parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+        self.ld_json: List[str] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self.parser.feed(chunk)
+        self._drain()
+
+    def _drain(self) -> None:
+        for _, elem in self.parser.read_events():
+            if elem.tag in ("script", "style"):
+                if elem.get("type") == LD_JSON_TYPE and elem.text:
+                    self.ld_json.append(elem.text)
+                elem.clear(keep_tail=True)
+
+    def close(self) -> Tuple[List[JobResult], List[str]]:
+        """Finish parsing and return (results, JSON-LD blobs)."""
+        try:
+            root = self.parser.close()
+        except etree.XMLSyntaxError:
+            root = None  # empty body: libxml2 found no element at all
+        self._drain()
+        if root is None:
+            return [], self.ld_json
+
+        results = []
+        seen = set()
+        for a in _JOB_ANCHORS(root):
+            # dedupe by canonical link (strip query) before doing any text extraction
+            link, norm = _canonical_link(a.get("href"))
+            if norm in seen:
+                continue
+            title = "".join(t.strip() for t in a.itertext())
+            if not title:
+                continue
+            seen.add(norm)
+            parent = a.getparent()
+            texts = []
+            if parent is not None:
+                texts = [t for t in (s.strip() for s in parent.itertext()) if t and t != title]
+            results.append(_job_result(link, title, texts))
+        return results, self.ld_json
+
+def _scrape_soup(content: bytes, encoding: Optional[str] = None):
+    # Only build the <body> subtree; JSON-LD is scanned from the raw bytes. Straining down to
+    # just <a> would detach anchors from the parent text the location heuristic reads.
+    # A known charset skips BeautifulSoup's encoding detection.
+    soup = BeautifulSoup(content, "html.parser", parse_only=_BODY_ONLY, from_encoding=encoding)
+    if not soup.contents:
+        # no explicit <body> tag; html.parser doesn't imply one
+        soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
     results = []
+    seen = set()
 
-    # Heuristic: anchors with meaningful text
-    for a in soup.find_all('a', href=True):
+    # Heuristic: anchors with meaningful text, on suspect job links
+    for a in soup.find_all('a', href=_JOB_HREF):
         href = a['href']
+        # dedupe by canonical link (strip query) before doing any text extraction
+        link, norm = _canonical_link(href)
+        if norm in seen:
+            continue
         title = a.get_text(strip=True)
         if not title or len(title) < 3:
             h3 = a.find('h3')
@@ -202,41 +509,98 @@ def fetch_search_results(url: str, timeout: int = 10) -> List[Dict[str, str]]:
                 title = h3.get_text(strip=True)
         if not title:
             continue
-
-        # suspect job link patterns
-        if ("/careers" in href or "/about/careers" in href or "/jobs/results" in href) and ("/" in href):
-            link = urllib.parse.urljoin(BASE_URL, href)
-            location = ""
-            snippet = ""
-            parent = a.parent
-            if parent:
-                texts = [t.strip() for t in parent.stripped_strings if t.strip() and t.strip() != title]
-                if texts:
-                    # find candidate location-like text
-                    for t in texts:
-                        if len(t) < 100 and any(x in t for x in (",", "India", "USA", "UK", "Remote")):
-                            location = t
-                            break
-                    if not snippet and texts:
-                        snippet = texts[0][:300]
-            results.append({"title": title, "link": link, "location": location, "snippet": snippet})
-
-    # dedupe by canonical link (strip query)
-    seen = set()
-    dedup = []
-    for r in results:
-        link = r.get("link") or ""
-        norm = link.split('?')[0]
-        if norm in seen:
-            continue
         seen.add(norm)
-        dedup.append(r)
+
+        texts = []
+        if a.parent:
+            texts = [t.strip() for t in a.parent.stripped_strings if t.strip() and t.strip() != title]
+        results.append(_job_result(link, title, texts))
+    # JSON-LD is only read if no anchors matched; scan the raw bytes lazily rather than
+    # walking the tree again, so the soup can be dropped as soon as we return
+    return results, (m.group(1).strip() for m in _LD_JSON_SCRIPT.finditer(content))
+
+def _json_results(data: dict) -> List[JobResult]:
+    results = []
+    for job in data["jobs"]:
+        locations = job.get("locations") or []
+        results.append(JobResult(
+            title=job["title"],
+            link=job["apply_url"],
+            location=locations[0].get("display", "") if locations else "",
+            snippet=(job.get("summary") or "")[:300],
+        ))
+    return results
+
+async def _fetch_page(client: httpx.AsyncClient, url: str, timeout: int):
+    """Return (results, JSON-LD blobs, why the JSON endpoint was skipped or "")."""
+    json_error = ""
+    if JSON_ENDPOINT:
+        # same filter params as the HTML page, answered as JSON; no HTML parse needed
+        try:
+            resp = await client.get(JSON_ENDPOINT, params=urllib.parse.urlsplit(url).query, timeout=timeout)
+            resp.raise_for_status()
+            return _json_results(json_loads(resp.content)), [], ""
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # endpoint down or schema changed: fall back to scraping the HTML page
+            json_error = f"{type(e).__name__}: {e}"
+
+    async with client.stream("GET", url, timeout=timeout) as resp:
+        resp.raise_for_status()
+        if not USE_LXML:
+            results, ld_json = _scrape_soup(await resp.aread(), resp.charset_encoding)
+        else:
+            scraper = _StreamScraper(resp.charset_encoding)
+            async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                scraper.feed(chunk)
+            results, ld_json = scraper.close()
+    return results, ld_json, json_error
+
+async def fetch_pages(client: httpx.AsyncClient, urls: List[str], timeout: int = 10) -> list:
+    """Fetch and parse several results pages concurrently.
+
+    Returns one _fetch_page tuple per URL, or the exception that URL raised.
+    """
+    return await asyncio.gather(*(_fetch_page(client, u, timeout) for u in urls), return_exceptions=True)
+
+# Widget changes rerun the whole script; keep identical searches from re-fetching the page.
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_search_results(url: str, pages: int = 1, timeout: int = 10) -> List[JobResult]:
+    urls = [_page_url(url, n) for n in range(1, min(pages, MAX_PAGES) + 1)]
+    loop, client = get_fetcher()
+    fetched = asyncio.run_coroutine_threadsafe(fetch_pages(client, urls, timeout), loop).result()
+    # without the first page there is nothing to show; later failed pages are skipped, but said so
+    if isinstance(fetched[0], BaseException):
+        raise fetched[0]
+    failed = [page for page in fetched if isinstance(page, BaseException)]
+    if failed:
+        st.warning(f"{len(failed)} of {len(fetched)} result pages could not be fetched and were skipped: "
+                   f"{type(failed[0]).__name__}: {failed[0]}")
+    fetched = [page for page in fetched if not isinstance(page, BaseException)]
+
+    json_error = next((err for _, _, err in fetched if err), "")
+    if json_error:
+        st.warning("GOOGLE_CAREERS_JSON_URL request failed, so the HTML results page was scraped instead: "
+                   + json_error)
+
+    # each page is already deduped while parsing; pages finish in any order, so
+    # duplicates across pages are dropped here to keep the first one in page order
+    if len(fetched) == 1:
+        dedup = fetched[0][0]
+    else:
+        seen = set()
+        dedup = []
+        for results, _, _ in fetched:
+            for r in results:
+                norm = r.link.split('?', 1)[0]
+                if norm not in seen:
+                    seen.add(norm)
+                    dedup.append(r)
 
     # fallback to parsing JSON-LD if nothing found
     if not dedup:
-        for script in soup.find_all('script', type='application/ld+json'):
+        for text in (text for _, ld_json, _ in fetched for text in ld_json):
             try:
-                jd = json.loads(script.string or "{}")
+                jd = json_loads(text)
             except Exception:
                 continue
             jobs = []
@@ -253,7 +617,7 @@ def fetch_search_results(url: str, timeout: int = 10) -> List[Dict[str, str]]:
                     addr = jl.get('address', {})
                     location = addr.get('addressLocality', '') or addr.get('addressRegion', '') or addr.get('addressCountry', '')
                 snippet = (job.get('description') or '')[:300]
-                dedup.append({"title": title, "link": link, "location": location, "snippet": snippet})
+                dedup.append(JobResult(title, link, location, snippet))
 
     return dedup
 
@@ -286,7 +650,9 @@ The app builds a Google Careers search URL and attempts to parse the results pag
     # Extract filters
     try:
         if llm_mode:
-            filters = extract_with_llm(user_query, openai_api_key)
+            placeholder = st.empty()
+            filters = extract_with_llm_cached(user_query, openai_api_key, placeholder)
+            placeholder.empty()
         else:
             filters = heuristic_extract_filters(user_query)
     except Exception as e:
@@ -299,10 +665,12 @@ The app builds a Google Careers search URL and attempts to parse the results pag
     url = build_google_careers_url(filters)
     st.markdown(f"**Search URL:** [{url}]({url})")
 
+    pages = st.number_input("Result pages to fetch", min_value=1, max_value=MAX_PAGES, value=1)
+
     if st.button("Search Google Careers"):
         try:
             with st.spinner("Fetching results from Google Careers..."):
-                results = fetch_search_results(url)
+                results = fetch_search_results(url, int(pages))
         except Exception as e:
             st.error("Failed to fetch results: " + str(e))
             results = []
@@ -312,10 +680,10 @@ The app builds a Google Careers search URL and attempts to parse the results pag
         else:
             st.subheader(f"Found {len(results)} result(s)")
             for r in results:
-                title = r.get("title") or "(no title)"
-                link = r.get("link") or url
-                location = r.get("location", "")
-                snippet = r.get("snippet", "")
+                title = r.title or "(no title)"
+                link = r.link or url
+                location = r.location
+                snippet = r.snippet
                 st.markdown(f"**[{title}]({link})**")
                 if location:
                     st.write(f"Location: {location}")